@@ -35,8 +35,9 @@ echo.
 echo ========================================
 echo Build successful!
 echo ========================================
-echo Executable location: dist\Whispera.exe
+echo Executable location: dist\Whispera\Whispera.exe
 echo.
-echo IMPORTANT: Copy the .env file to the dist folder before running the exe!
+echo IMPORTANT: Copy the .env file to the dist\Whispera folder before running the exe!
+echo Ship the whole dist\Whispera folder, not just the exe.
 echo.
 pause
@@ -27,21 +27,51 @@ if os.path.exists('build'):
 if os.path.exists('Whispera.spec'):
     os.remove('Whispera.spec')
 
+# Bundle layout: one-folder by default (no self-extraction on every launch).
+# Pass --onefile to build a single self-extracting exe instead (slower startup).
+onefile = '--onefile' in sys.argv[1:]
+if onefile:
+    layout_args = ['--onefile']
+    exe_path = 'dist\\Whispera.exe'
+else:
+    layout_args = ['--onedir', '--contents-directory=_internal']
+    exe_path = 'dist\\Whispera\\Whispera.exe'
+
 # PyInstaller arguments
 args = [
     'main.py',
     '--name=Whispera',
-    '--onefile',
+    *layout_args,
     '--windowed',  # No console window (GUI app)
     '--hidden-import=openai',
-    '--hidden-import=dotenv',
     '--hidden-import=src.back',
     '--hidden-import=src.front',
-    '--collect-all=openai',
+    # Only openai's modules and data files, not everything collect-all drags in
+    '--collect-submodules=openai',
+    '--collect-data=openai',
+    '--exclude-module=openai.tests',
+    '--exclude-module=pytest',
+    '--exclude-module=setuptools._vendor',
+    # Stdlib/test bloat a GUI transcription tool never loads
+    '--exclude-module=tkinter.test',
+    '--exclude-module=test',
+    '--exclude-module=unittest',
+    '--exclude-module=pydoc_data',
+    '--exclude-module=xmlrpc',
+    '--exclude-module=http.server',
+    '--exclude-module=distutils',
+    '--exclude-module=pip',
+    '--exclude-module=numpy.tests',
+    '--exclude-module=pandas',
+    '--noupx',  # UPX-packed binaries are decompressed into RAM on every launch
     '--noconfirm',
     '--clean',
 ]
 
+# Strip debug symbols on non-Windows builds (no strip tool on Windows)
+if sys.platform != 'win32':
+    args.append('--strip')
+
 # SECURITY: Do NOT include .env file in the build
 # Users should create their own .env file next to the exe, or use the GUI to enter API key
 print("🔒 Security: .env file will NOT be included in the build.")
@@ -55,7 +85,10 @@ print("\n" + "="*50)
 print("✅ Build complete! Executable is in the 'dist' folder.")
 print("="*50)
 print("\n📝 IMPORTANT:")
-print("   1. The executable is: dist\\Whispera.exe")
+print(f"   1. The executable is: {exe_path}")
+if not onefile:
+    print("   2. Ship the whole dist\\Whispera folder - the exe needs its _internal folder")
+    print("      (build with --onefile for a single, slower-starting exe)")
 print("\n🔒 SECURITY - API Key Configuration:")
 print("   Option 1 (Recommended): Enter API key directly in the GUI")
 print("      - Launch the app and enter your API key in the GUI")
@@ -66,6 +99,8 @@ print("      - Add this line: OPENAI_API_KEY=your_api_key_here")
 print("\n⚠️  SECURITY NOTE:")
 print("   The .env file is NOT included in the build for security reasons.")
 print("   Each user must provide their own API key.")
+print("\n⚡ Startup: built with --noupx - binaries are a bit larger on disk,")
+print("   but nothing has to be decompressed in memory when the app starts.")
 print("\n📦 FFmpeg for Large Files:")
 print("   For automatic file splitting, ffmpeg is needed.")
 print("   Option 1: Place ffmpeg.exe in the same folder as the .exe")
@@ -1,24 +1,15 @@
 """Configuration management for the Audio Transcription App."""
 
+import functools
+import importlib.util
 import os
 import sys
-from dotenv import load_dotenv
 
-# Suppress pydub warnings about ffmpeg - we'll configure it explicitly
-import warnings
-warnings.filterwarnings("ignore", category=RuntimeWarning, module="pydub")
-
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
-    AudioSegment = None
-
-from .utils import check_ffmpeg, configure_pydub
+from .utils import check_ffmpeg, get_user_ffmpeg_dir, reset_ffmpeg_cache
 from .logging_config import logger
 
 
+@functools.lru_cache(maxsize=1)
 def get_application_path():
     """Get the application path (works for both script and frozen exe)."""
     if getattr(sys, 'frozen', False):
@@ -31,23 +22,62 @@ def get_application_path():
         return os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
 
 
+@functools.lru_cache(maxsize=1)
+def use_static_ffmpeg():
+    """Put ffmpeg from the optional static-ffmpeg package on PATH, if installed.
+
+    The first call may download the binaries, so it must run off the Tk
+    thread (the GUI's startup probe or the transcription worker).
+
+    Returns:
+        bool: True if static-ffmpeg provided the binaries
+    """
+    if importlib.util.find_spec("static_ffmpeg") is None:
+        return False
+    try:
+        import static_ffmpeg
+        static_ffmpeg.add_paths()
+    except Exception as e:
+        logger.warning(f"static-ffmpeg is installed but could not be used: {e}")
+        return False
+    # PATH changed, so earlier "not found" lookups are stale
+    reset_ffmpeg_cache()
+    logger.info("Using ffmpeg from the static-ffmpeg package")
+    return True
+
+
+def get_ffmpeg_install_root():
+    """Get the folder ffmpeg tools should be downloaded into.
+
+    Prefers the per-user cache so repeat installs and upgrades reuse one copy,
+    falling back to the application folder.
+    """
+    user_ffmpeg_dir = get_user_ffmpeg_dir()
+    if user_ffmpeg_dir:
+        return os.path.dirname(user_ffmpeg_dir)
+    return get_application_path()
+
+
 def load_config():
     """Load configuration from .env file and set up ffmpeg."""
+    # Imported here: env_manager depends on get_application_path from this module
+    from .env_manager import read_env_file
+
     application_path = get_application_path()
-    env_path = os.path.join(application_path, '.env')
-    load_dotenv(env_path)
+    # Like python-dotenv, values already set in the environment win
+    for key, value in read_env_file().items():
+        os.environ.setdefault(key, value)
 
     # Note: ffmpeg download is handled by the GUI on startup to show status messages
     # This allows users to see progress when running as .exe (no console)
 
-    # Check for ffmpeg in default location (ffmpeg/ folder at project root)
-    # We always use the default location, ignoring FFMPEG_PATH env var
+    # Look for ffmpeg in order: PATH, per-user cache, then the default location
+    # (ffmpeg/ folder at project root). The static-ffmpeg package is set up
+    # later on a worker thread, since its first use downloads the binaries.
+    # We ignore the FFMPEG_PATH env var here
+    # check_ffmpeg caches its lookup, so repeat calls don't probe the disk again
     ffmpeg_available, ffmpeg_path = check_ffmpeg(None)
 
-    # Configure pydub to use ffmpeg if available
-    if PYDUB_AVAILABLE and ffmpeg_available and ffmpeg_path:
-        configure_pydub(ffmpeg_path)
-
     # Get API key from environment
     openai_api_key = os.getenv('OPENAI_API_KEY')
 
@@ -55,6 +85,5 @@ def load_config():
         'application_path': application_path,
         'ffmpeg_available': ffmpeg_available,
         'ffmpeg_path': ffmpeg_path,
-        'openai_api_key': openai_api_key,
-        'pydub_available': PYDUB_AVAILABLE
+        'openai_api_key': openai_api_key
     }
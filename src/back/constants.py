@@ -1,32 +1,43 @@
 """Constants for the Audio Transcription App."""
 
+from typing import Final, FrozenSet, Tuple
+
 # OpenAI Whisper API model
-AUDIO_MODEL = "whisper-1"
+AUDIO_MODEL: Final[str] = "whisper-1"
 
-# Supported audio/video file formats
-SUPPORTED_FORMATS = ['.mp3', '.mp4', '.mpeg', '.mpga', '.m4a', '.wav', '.webm']
+# Supported audio/video file formats (frozenset for O(1) extension lookups)
+SUPPORTED_FORMATS: Final[FrozenSet[str]] = frozenset(
+    {'.mp3', '.mp4', '.mpeg', '.mpga', '.m4a', '.wav', '.webm'}
+)
 
 # File size limits
-MAX_FILE_SIZE_MB = 25  # Maximum file size for direct upload (MB)
-MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024  # Convert to bytes
-CHUNK_SIZE_MB = 20  # Size for splitting large files (MB)
+MAX_FILE_SIZE_MB: Final[int] = 25  # Maximum file size for direct upload (MB)
+MAX_FILE_SIZE_BYTES: Final[int] = MAX_FILE_SIZE_MB * 1024 * 1024  # Convert to bytes
+CHUNK_SIZE_MB: Final[int] = 20  # Size for splitting large files (MB)
 
 # Audio processing settings
-AUDIO_BITRATE_HIGH = "128k"  # High quality bitrate for audio chunks
-AUDIO_BITRATE_LOW = "64k"    # Low quality bitrate if high quality is too large
-CHUNK_SIZE_SAFETY_FACTOR = 0.9  # Use 90% of max size to be safe
+AUDIO_BITRATE_HIGH: Final[str] = "128k"  # High quality bitrate for audio chunks
+CHUNK_SIZE_SAFETY_FACTOR: Final[float] = 0.9  # Use 90% of max size to be safe
+MAX_CONCURRENT_CHUNKS: Final[int] = 5  # Chunks transcribed in parallel (API rate limits)
+MERGE_SMALL_CHUNKS: Final[bool] = True  # Pack audio into as few full-size requests as possible
+MERGED_CHUNK_SIZE_FACTOR: Final[float] = 0.95  # Fill merged chunks up to 95% of the upload limit
+
+# OpenAI API connection settings
+API_TIMEOUT_SECONDS: Final[float] = 600.0  # Whisper can take minutes on a full-size chunk
+API_CONNECT_TIMEOUT_SECONDS: Final[float] = 10.0
 
 # GUI settings
-WINDOW_TITLE = "Whispera"
-WINDOW_SIZE = "800x600"
-FONT_TITLE = ("Arial", 16, "bold")
-FONT_NORMAL = ("Arial", 9)
-FONT_TEXT = ("Arial", 10)
+WINDOW_TITLE: Final[str] = "Whispera"
+WINDOW_SIZE: Final[str] = "800x600"
+FONT_TITLE: Final[Tuple[str, int, str]] = ("Arial", 16, "bold")
+FONT_NORMAL: Final[Tuple[str, int]] = ("Arial", 9)
+FONT_TEXT: Final[Tuple[str, int]] = ("Arial", 10)
+EVENT_POLL_INTERVAL_MS: Final[int] = 50  # How often the GUI applies worker-thread events
 
 # Progress messages
-PROGRESS_READY = "Ready"
-PROGRESS_PROCESSING = "Processing file..."
-PROGRESS_SPLITTING = "File is large, splitting into chunks..."
-PROGRESS_TRANSCRIBING = "Transcribing audio..."
-PROGRESS_COMBINING = "Combining transcriptions..."
-PROGRESS_COMPLETE = "Complete!"
+PROGRESS_READY: Final[str] = "Ready"
+PROGRESS_PROCESSING: Final[str] = "Processing file..."
+PROGRESS_SPLITTING: Final[str] = "File is large, splitting into chunks..."
+PROGRESS_TRANSCRIBING: Final[str] = "Transcribing audio..."
+PROGRESS_COMBINING: Final[str] = "Combining transcriptions..."
+PROGRESS_COMPLETE: Final[str] = "Complete!"
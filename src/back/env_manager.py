@@ -1,23 +1,38 @@
 """Environment file management utilities."""
 
+import functools
 import os
 from .config import get_application_path
 
 
-def read_env_file():
-    """Read .env file and return as dictionary."""
-    env_path = os.path.join(get_application_path(), '.env')
+@functools.lru_cache(maxsize=4)
+def _parse_env(env_path, mtime):
+    """Parse a .env file; cached per (path, mtime) so edits invalidate it."""
     env_vars = {}
-    if os.path.exists(env_path):
+    if mtime:
         with open(env_path) as f:
             for line in f:
                 line = line.strip()
                 if line and '=' in line and not line.startswith('#'):
+                    # Like python-dotenv: allow "export KEY=..." and quoted values
+                    if line.startswith('export '):
+                        line = line[len('export '):]
                     key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
+                    value = value.strip()
+                    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                        value = value[1:-1]
+                    env_vars[key.strip()] = value
     return env_vars
 
 
+def read_env_file():
+    """Read .env file and return as dictionary."""
+    env_path = os.path.join(get_application_path(), '.env')
+    mtime = os.path.getmtime(env_path) if os.path.exists(env_path) else 0
+    # Return a copy so callers can't mutate the cached dict
+    return dict(_parse_env(env_path, mtime))
+
+
 def write_env_file(env_vars):
     """Write dictionary to .env file."""
     env_path = os.path.join(get_application_path(), '.env')
@@ -25,3 +40,4 @@ def write_env_file(env_vars):
         if 'OPENAI_API_KEY' in env_vars:
             f.write(f"OPENAI_API_KEY={env_vars['OPENAI_API_KEY']}\n")
         # FFMPEG_PATH is no longer used - app always uses default ffmpeg/ folder location
+    _parse_env.cache_clear()
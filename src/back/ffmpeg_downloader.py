@@ -2,15 +2,121 @@
 
 import os
 import sys
+import urllib.error
 import urllib.request
 import zipfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from .utils import reset_ffmpeg_cache
 from .logging_config import logger
 
 FFMPEG_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
 FFMPEG_ZIP = "ffmpeg.zip"
 FFMPEG_DIR = "ffmpeg"
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB read/write buffer
+DOWNLOAD_PROGRESS_EVERY = 5  # Report progress every N chunks
+VALIDATOR_SUFFIX = ".validator"  # Sidecar holding the archive's ETag/Last-Modified
+
+
+def _read_validator(validator_path):
+    """Return the saved ETag/Last-Modified of a partial download, or None."""
+    try:
+        with open(validator_path, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _remove_archive(zip_path):
+    """Delete a downloaded archive and its saved validator, if present."""
+    for path in (zip_path, zip_path + VALIDATOR_SUFFIX):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _download_archive(zip_path, status_callback=None):
+    """Stream the ffmpeg archive to disk in large chunks.
+
+    A partial archive left behind by an interrupted download is resumed with
+    an HTTP Range request when the server supports it. The request carries
+    If-Range with the ETag/Last-Modified saved from the original response, so
+    if the release has changed since, the server sends the whole new archive
+    instead of appending its tail to the old one.
+
+    Args:
+        zip_path: Destination path for the archive
+        status_callback: Optional callback function(status_message) to update GUI
+    """
+    validator_path = zip_path + VALIDATOR_SUFFIX
+    resume_from = os.path.getsize(zip_path) if os.path.exists(zip_path) else 0
+    validator = _read_validator(validator_path) if resume_from else None
+    headers = {'Accept-Encoding': 'identity'}
+    if validator:
+        headers['Range'] = f"bytes={resume_from}-"
+        headers['If-Range'] = validator
+        logger.info(f"Resuming download from {resume_from} bytes")
+    else:
+        # Without a validator a partial file can't be trusted, so start over
+        resume_from = 0
+
+    try:
+        response = urllib.request.urlopen(urllib.request.Request(FFMPEG_URL, headers=headers))
+    except urllib.error.HTTPError as e:
+        if e.code != 416 or not resume_from:
+            raise
+        # Range not satisfiable: the leftover file is stale, start over
+        _remove_archive(zip_path)
+        return _download_archive(zip_path, status_callback)
+
+    with response:
+        # Servers that ignore Range, or whose file changed, answer 200 with the full body
+        if response.status != 206:
+            resume_from = 0
+            # Strong ETags only; If-Range doesn't accept weak ones
+            etag = response.headers.get('ETag')
+            if etag and etag.startswith('W/'):
+                etag = None
+            validator = etag or response.headers.get('Last-Modified')
+            if validator:
+                with open(validator_path, 'w', encoding='utf-8') as f:
+                    f.write(validator)
+            elif os.path.exists(validator_path):
+                os.remove(validator_path)
+        downloaded = resume_from
+        chunks = 0
+        with open(zip_path, 'ab' if resume_from else 'wb') as f:
+            while True:
+                chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                downloaded += len(chunk)
+                chunks += 1
+                if chunks % DOWNLOAD_PROGRESS_EVERY == 0:
+                    msg = f"Downloaded {downloaded // (1024 * 1024)} MB"
+                    logger.debug(msg)
+                    if status_callback:
+                        status_callback(msg)
+
+
+def _extract_member(zip_path, member, target):
+    """Copy one archive member to target through its own ZipFile handle.
+
+    The member is written to a temporary file and only moved into place once
+    it has been fully read and its CRC checked, so a failed extraction never
+    leaves a truncated executable behind.
+    """
+    part_path = target + ".part"
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            with zip_ref.open(member) as src, open(part_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=DOWNLOAD_CHUNK_SIZE)
+        os.replace(part_path, target)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
 
 
 def download_ffmpeg_tools(app_path, status_callback=None):
@@ -65,8 +171,10 @@ def download_ffmpeg_tools(app_path, status_callback=None):
     if status_callback:
         status_callback(msg)
 
+    zip_path = os.path.join(app_path, FFMPEG_ZIP)
+    download_complete = False
     try:
-        zip_path = os.path.join(app_path, FFMPEG_ZIP)
+        os.makedirs(app_path, exist_ok=True)
 
         # Download the zip file
         msg = "Downloading from server..."
@@ -74,99 +182,62 @@ def download_ffmpeg_tools(app_path, status_callback=None):
         if status_callback:
             status_callback(msg)
 
-        urllib.request.urlretrieve(FFMPEG_URL, zip_path)
+        _download_archive(zip_path, status_callback)
+        download_complete = True
         msg = "✓ Download complete!"
         logger.info(msg)
         if status_callback:
             status_callback(msg)
 
-        # Extract the zip file
+        # Extract only the executables we need, straight into the ffmpeg folder
         msg = "Extracting ffmpeg..."
         logger.info(msg)
         if status_callback:
             status_callback(msg)
-        extract_dir = os.path.join(app_path, "ffmpeg_extract_temp")
+
+        if not os.path.exists(ffmpeg_dir):
+            os.makedirs(ffmpeg_dir)
+
+        # Map archive basenames to their destination, only for what is missing
+        wanted = {}
+        if not ffmpeg_exists:
+            wanted["ffmpeg.exe"] = ffmpeg_exe
+        if not ffprobe_exists:
+            wanted["ffprobe.exe"] = ffprobe_exe
+
+        # Find the archive members for the missing executables
+        members = {}
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-
-        # Find ffmpeg.exe and ffprobe.exe in the extracted folder
-        ffmpeg_found = False
-        ffprobe_found = False
-
-        for root, dirs, files in os.walk(extract_dir):
-            # Look for the bin directory which contains the executables
-            if "bin" in dirs and "ffmpeg-" in root:
-                bin_dir = os.path.join(root, "bin")
-                if os.path.exists(bin_dir):
-                    # Create target directory
-                    if not os.path.exists(ffmpeg_dir):
-                        os.makedirs(ffmpeg_dir)
-
-                    # Copy ffmpeg.exe if missing
-                    if not ffmpeg_exists:
-                        ffmpeg_src = os.path.join(bin_dir, "ffmpeg.exe")
-                        if os.path.exists(ffmpeg_src):
-                            shutil.copy(ffmpeg_src, ffmpeg_exe)
-                            msg = f"✓ ffmpeg.exe copied to {ffmpeg_dir}/"
-                            logger.info(msg)
-                            if status_callback:
-                                status_callback(msg)
-                            ffmpeg_found = True
-
-                    # Copy ffprobe.exe if missing
-                    if not ffprobe_exists:
-                        ffprobe_src = os.path.join(bin_dir, "ffprobe.exe")
-                        if os.path.exists(ffprobe_src):
-                            shutil.copy(ffprobe_src, ffprobe_exe)
-                            msg = f"✓ ffprobe.exe copied to {ffmpeg_dir}/"
-                            logger.info(msg)
-                            if status_callback:
-                                status_callback(msg)
-                            ffprobe_found = True
-
-                    if (ffmpeg_exists or ffmpeg_found) and (ffprobe_exists or ffprobe_found):
-                        break
-
-        # Fallback: search for files directly (older extraction structure)
-        if not ffmpeg_found and not ffmpeg_exists:
-            msg = "Searching for ffmpeg files..."
-            logger.info(msg)
-            if status_callback:
-                status_callback(msg)
-            for root, dirs, files in os.walk(extract_dir):
-                if "ffmpeg.exe" in files:
-                    ffmpeg_src = os.path.join(root, "ffmpeg.exe")
-                    if not os.path.exists(ffmpeg_dir):
-                        os.makedirs(ffmpeg_dir)
-                    shutil.copy(ffmpeg_src, ffmpeg_exe)
-                    msg = f"✓ ffmpeg.exe copied to {ffmpeg_dir}/"
+            for info in zip_ref.infolist():
+                name = os.path.basename(info.filename)
+                if name in wanted and name not in members:
+                    members[name] = info.filename
+
+        # zlib releases the GIL, so both executables decompress side by side
+        if members:
+            with ThreadPoolExecutor(max_workers=len(members)) as executor:
+                futures = {
+                    executor.submit(_extract_member, zip_path, member, wanted[name]): name
+                    for name, member in members.items()
+                }
+                for future in as_completed(futures):
+                    future.result()
+                    msg = f"✓ {futures[future]} copied to {ffmpeg_dir}/"
                     logger.info(msg)
                     if status_callback:
                         status_callback(msg)
-                    ffmpeg_found = True
-
-                    # Also look for ffprobe.exe in the same directory
-                    if not ffprobe_exists:
-                        ffprobe_src = os.path.join(root, "ffprobe.exe")
-                        if os.path.exists(ffprobe_src):
-                            shutil.copy(ffprobe_src, ffprobe_exe)
-                            msg = f"✓ ffprobe.exe copied to {ffmpeg_dir}/"
-                            logger.info(msg)
-                            if status_callback:
-                                status_callback(msg)
-                            ffprobe_found = True
-                    break
 
         # Clean up
-        if os.path.exists(zip_path):
-            os.remove(zip_path)
-        if os.path.exists(extract_dir):
-            shutil.rmtree(extract_dir, ignore_errors=True)
+        _remove_archive(zip_path)
 
         # Final check
         final_ffmpeg = os.path.exists(ffmpeg_exe)
         final_ffprobe = os.path.exists(ffprobe_exe)
 
+        if final_ffmpeg or final_ffprobe:
+            # New binaries on disk - make the next ffmpeg lookup probe again
+            reset_ffmpeg_cache()
+
         if final_ffmpeg and final_ffprobe:
             msg = "✅ ffmpeg setup complete! Both ffmpeg.exe and ffprobe.exe are ready."
             logger.info(msg)
@@ -188,6 +259,14 @@ def download_ffmpeg_tools(app_path, status_callback=None):
             return False, False
 
     except Exception as e:
+        if download_complete:
+            # A full archive that fails to extract (e.g. BadZipFile) is corrupt;
+            # drop it so the next launch downloads a fresh copy. An interrupted
+            # download is kept so it can be resumed.
+            try:
+                _remove_archive(zip_path)
+            except OSError:
+                pass
         error_msg = f"❌ Error downloading ffmpeg: {e}"
         logger.error(error_msg, exc_info=True)
         if status_callback:
@@ -7,6 +7,9 @@ import sys
 # Default log level
 DEFAULT_LOG_LEVEL = "INFO"
 
+# Set once the shared root handler has been installed
+_CONFIGURED = False
+
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter to add colors to log messages."""
@@ -20,14 +23,77 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    def __init__(self, *args, **kwargs):
+        """Initialize the formatter and cache the reset sequence."""
+        super().__init__(*args, **kwargs)
+        self._reset = self.COLORS["RESET"]
+
     def format(self, record):
         """Format the log message with colors based on the log level."""
-        log_message = super().format(record)
-        return f"{self.COLORS.get(record.levelname, '')}{log_message}{self.COLORS['RESET']}"
+        return f"{self.COLORS.get(record.levelname, '')}{super().format(record)}{self._reset}"
+
+
+class BinaryStreamHandler(logging.StreamHandler):
+    """Stream handler that writes pre-encoded bytes to the stream's binary buffer."""
+
+    def __init__(self, stream=None):
+        """Initialize the handler and cache the encoding and encoded terminator."""
+        super().__init__(stream)
+        self._buffer = getattr(self.stream, "buffer", None)
+        self._encoding = getattr(self.stream, "encoding", None) or "utf-8"
+        self._terminator = self.terminator.encode(self._encoding)
+
+    def emit(self, record):
+        """Emit a record, bypassing the text layer when a binary buffer exists."""
+        if self._buffer is None:
+            super().emit(record)
+            return
+        try:
+            data = self.format(record).encode(self._encoding, "replace") + self._terminator
+            # Flush pending text (e.g. print output) first to keep ordering
+            self.stream.flush()
+            self._buffer.write(data)
+            self._buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _configure_root_handler() -> None:
+    """Attach the single console handler to the root logger (once).
+
+    The handler has no level of its own, so each named logger's level decides
+    what gets through. The root logger keeps its default WARNING level, which
+    keeps third-party INFO chatter (httpx, openai) out of the console.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
+    # Create console handler
+    console_handler = BinaryStreamHandler(sys.stdout)
+
+    # Create formatter - colors only when writing to a terminal (honors NO_COLOR)
+    # stdout is None in a --windowed exe, so guard before calling isatty()
+    use_color = (
+        sys.stdout is not None
+        and sys.stdout.isatty()
+        and os.environ.get("NO_COLOR") is None
+    )
+    formatter_cls = ColoredFormatter if use_color else logging.Formatter
+    formatter = formatter_cls(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    console_handler.setFormatter(formatter)
+
+    logging.getLogger().addHandler(console_handler)
+    _CONFIGURED = True
 
 
 def setup_logger(name: str = "audio_transcription", level: int = None) -> logging.Logger:
-    """Configure and return a logger with colored output.
+    """Configure and return a logger that emits through the shared root handler.
 
     Args:
         name: Logger name
@@ -43,26 +109,13 @@ def setup_logger(name: str = "audio_transcription", level: int = None) -> loggin
         log_level_str = os.getenv("LOG_LEVEL", DEFAULT_LOG_LEVEL).upper()
         level = getattr(logging, log_level_str, logging.INFO)
 
+    _configure_root_handler()
+
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-
-    # Create formatter
-    formatter = ColoredFormatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(formatter)
-
-    # Add handler to logger if not already added
-    if not logger.handlers:
-        logger.addHandler(console_handler)
-
-    # Prevent propagation to the root logger
-    logger.propagate = False
+    # Records reach the console through the root logger's handler
+    logger.propagate = True
 
     return logger
 
@@ -83,5 +136,3 @@ def set_log_level(level: str) -> None:
         raise ValueError(f"Invalid log level: {level}")
 
     logger.setLevel(numeric_level)
-    for handler in logger.handlers:
-        handler.setLevel(numeric_level)
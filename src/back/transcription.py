@@ -1,56 +1,273 @@
 """Transcription assistant for audio-to-text conversion."""
 
+import contextlib
+import importlib.util
 import os
+import queue
+import re
+import shutil
+import subprocess
 import tempfile
-from openai import OpenAI
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from .logging_config import logger
 
 from .constants import (
     AUDIO_MODEL,
+    API_TIMEOUT_SECONDS,
+    API_CONNECT_TIMEOUT_SECONDS,
     SUPPORTED_FORMATS,
     MAX_FILE_SIZE_BYTES,
     CHUNK_SIZE_MB,
     AUDIO_BITRATE_HIGH,
-    AUDIO_BITRATE_LOW,
     CHUNK_SIZE_SAFETY_FACTOR,
+    MAX_CONCURRENT_CHUNKS,
+    MERGE_SMALL_CHUNKS,
+    MERGED_CHUNK_SIZE_FACTOR,
     PROGRESS_SPLITTING,
     PROGRESS_TRANSCRIBING,
     PROGRESS_COMBINING,
     PROGRESS_COMPLETE,
 )
-from .utils import check_ffmpeg, configure_pydub, PYDUB_AVAILABLE
-
-# Import AudioSegment only if available
-if PYDUB_AVAILABLE:
-    from pydub import AudioSegment
-else:
-    AudioSegment = None
+from .config import use_static_ffmpeg
+from .utils import check_ffmpeg, get_ffprobe_path, popen_subprocess, run_subprocess
+
+
+# Lowercase extensions as a tuple so a single str.endswith() call checks them all
+_SUPPORTED_EXTS = tuple(ext.lower() for ext in SUPPORTED_FORMATS)
+
+# Matches the "Duration: HH:MM:SS.xx" line ffmpeg prints for its input
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+
+
+def _bitrate_bps(bitrate):
+    """Convert an ffmpeg bitrate string like "128k" to bits per second."""
+    if bitrate.lower().endswith("k"):
+        return int(float(bitrate[:-1]) * 1000)
+    return int(bitrate)
+
+
+def _probe_duration_ms(ffmpeg_path, audio_path):
+    """Get the duration of a media file in milliseconds.
+
+    Uses ffprobe next to ffmpeg, falling back to parsing ffmpeg's own input
+    summary when ffprobe is not available.
+    """
+    try:
+        result = run_subprocess(
+            [
+                get_ffprobe_path(ffmpeg_path), "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                audio_path,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        if result.returncode == 0 and result.stdout.strip():
+            return int(float(result.stdout.strip()) * 1000)
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        logger.debug("ffprobe unavailable, reading duration from ffmpeg output")
+
+    result = run_subprocess([ffmpeg_path, "-hide_banner", "-i", audio_path], capture_output=True, text=True)
+    match = _DURATION_RE.search(result.stderr or "")
+    if not match:
+        raise RuntimeError("Could not determine audio duration")
+    hours, minutes, seconds = match.groups()
+    return int((int(hours) * 3600 + int(minutes) * 60 + float(seconds)) * 1000)
+
+
+def _kill_when_set(event, process):
+    """Kill a running process once the event is set (used as a watcher thread)."""
+    event.wait()
+    if process.poll() is None:
+        process.kill()
+
+
+def _ffmpeg_split(ffmpeg_path, audio_path, chunk_duration_ms, bitrate, out_dir, on_chunk=None, cancel_event=None):
+    """Encode audio into MP3 chunks of a fixed duration with ffmpeg's segment muxer.
+
+    The segment list on stdout names each chunk once it is complete, so
+    callers can start uploading while later chunks are still being encoded.
+
+    Args:
+        ffmpeg_path: ffmpeg executable
+        audio_path: Input audio or video file
+        chunk_duration_ms: Duration of each chunk in milliseconds
+        bitrate: MP3 bitrate, e.g. "128k"
+        out_dir: Directory the chunks are written to
+        on_chunk: Optional callback called with each finished chunk path
+        cancel_event: Optional threading.Event; setting it kills ffmpeg. The caller
+            must set it once done with the split so the watcher thread exits.
+
+    Returns:
+        list: Chunk paths in playback order
+
+    Raises:
+        subprocess.CalledProcessError: If ffmpeg fails
+    """
+    cmd = [
+        ffmpeg_path, "-hide_banner", "-loglevel", "error",
+        "-i", audio_path,
+        "-vn",
+        "-f", "segment",
+        "-segment_time", f"{chunk_duration_ms / 1000:.3f}",
+        "-segment_list", "pipe:1",
+        "-segment_list_type", "flat",
+        "-c:a", "libmp3lame",
+        "-b:a", bitrate,
+        os.path.join(out_dir, "chunk_%03d.mp3"),
+    ]
+    chunk_paths = []
+    # stderr goes to a file so a chatty ffmpeg can't block on a full pipe
+    with tempfile.TemporaryFile() as stderr_file:
+        process = popen_subprocess(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+        if cancel_event is not None:
+            threading.Thread(target=_kill_when_set, args=(cancel_event, process), daemon=True).start()
+        with process.stdout:
+            for line in process.stdout:
+                name = line.decode(errors="replace").strip()
+                if not name:
+                    continue
+                chunk_path = os.path.join(out_dir, os.path.basename(name))
+                chunk_paths.append(chunk_path)
+                if on_chunk:
+                    on_chunk(chunk_path)
+        if process.wait() != 0:
+            stderr_file.seek(0)
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=stderr_file.read())
+    return chunk_paths
 
 
 class TranscriptionAssistant:
     """Assistant for transcribing audio to text."""
 
-    def __init__(self, audio_model=AUDIO_MODEL, api_key=None):
-        """Initialize the transcription assistant with specified model."""
+    def __init__(self, audio_model=AUDIO_MODEL, api_key=None, max_concurrent_chunks=MAX_CONCURRENT_CHUNKS,
+                 merge_small_chunks=MERGE_SMALL_CHUNKS):
+        """Initialize the transcription assistant with specified model.
+
+        Args:
+            audio_model: Whisper model name
+            api_key: OpenAI API key
+            max_concurrent_chunks: Maximum number of chunks transcribed in parallel
+            merge_small_chunks: Use as few, near-limit chunks as possible instead of
+                CHUNK_SIZE_MB chunks (fewer API round-trips, coarser progress)
+        """
         self.audio_model = audio_model
+        self.max_concurrent_chunks = max_concurrent_chunks
+        self.merge_small_chunks = merge_small_chunks
         self.api_key = api_key
-        self.client = None
-        if api_key:
-            self.client = OpenAI(api_key=api_key)
+        # Built on first use by the client property. The lock guards it against
+        # set_api_key() running in the GUI thread while chunk workers use it.
+        self._client = None
+        self._client_lock = threading.RLock()
+        self._client_users = 0
+        self._retired_clients = []
+        # Cancel functions of the split transcriptions in progress, called by cancel()
+        self._cancel_callbacks = set()
+        self._cancel_lock = threading.Lock()
+
+    @property
+    def client(self):
+        """OpenAI client, created on first use (None if no API key is set)."""
+        with self._client_lock:
+            if self._client is None and self.api_key:
+                # Imported here: the SDK takes a noticeable time to import and is
+                # only needed once a transcription actually starts
+                from openai import OpenAI
+
+                self._client = OpenAI(api_key=self.api_key, http_client=self._build_http_client())
+            return self._client
+
+    @contextlib.contextmanager
+    def _client_in_use(self):
+        """Snapshot the current client and keep it open while the block runs."""
+        with self._client_lock:
+            client = self.client
+            self._client_users += 1
+        try:
+            yield client
+        finally:
+            with self._client_lock:
+                self._client_users -= 1
+                self._close_retired_clients()
+
+    def _close_retired_clients(self):
+        """Close clients replaced by set_api_key() once no request is using them."""
+        with self._client_lock:
+            if self._client_users:
+                return
+            while self._retired_clients:
+                self._retired_clients.pop().close()
+
+    def _build_http_client(self):
+        """Create an HTTP client whose pool fits the parallel chunk uploads.
+
+        The SDK default pool is not sized for our workers, so concurrent chunks
+        would churn connections and redo TLS handshakes. HTTP/2 is enabled when
+        the optional h2 package is installed.
+        """
+        import httpx
+        from openai import DefaultHttpxClient
+
+        workers = max(1, self.max_concurrent_chunks)
+        return DefaultHttpxClient(
+            limits=httpx.Limits(max_connections=workers * 2, max_keepalive_connections=workers),
+            timeout=httpx.Timeout(API_TIMEOUT_SECONDS, connect=API_CONNECT_TIMEOUT_SECONDS),
+            http2=importlib.util.find_spec("h2") is not None,
+        )
 
     def set_api_key(self, api_key):
-        """Update the API key and recreate the client."""
-        self.api_key = api_key
-        if api_key:
-            self.client = OpenAI(api_key=api_key)
-        else:
-            self.client = None
+        """Update the API key; the client is recreated on next use."""
+        with self._client_lock:
+            self.api_key = api_key
+            if self._client is not None:
+                # Requests already in flight keep the old client until they finish
+                self._retired_clients.append(self._client)
+                self._client = None
+            self._close_retired_clients()
+
+    def cancel(self):
+        """Stop split transcriptions in progress.
+
+        ffmpeg is stopped and chunks that haven't started uploading are
+        dropped; uploads already in flight still run to completion.
+        """
+        with self._cancel_lock:
+            for cancel_job in self._cancel_callbacks:
+                cancel_job()
+
+    def _split_audio_file(self, audio_path, max_size_mb=CHUNK_SIZE_MB, on_chunk=None, out_dir=None,
+                          cancel_event=None):
+        """Split audio file into MP3 chunks that are under the size limit.
+
+        ffmpeg's segment muxer streams the input and writes the chunks to a
+        temporary directory, so the decoded audio is never held in memory.
+
+        Args:
+            audio_path: Path to the audio file to split
+            max_size_mb: Maximum size of each chunk in MB
+            on_chunk: Optional callback called with each chunk path as soon as
+                ffmpeg has finished writing it
+            out_dir: Directory for the chunks, owned and removed by the caller.
+                When None, a temporary directory is created (and removed on error).
+            cancel_event: Optional threading.Event that stops ffmpeg when set
+
+        Returns:
+            tuple: (chunk_paths: list or None, error: str or None)
+        """
+        file_size = os.path.getsize(audio_path)
+        max_size = max_size_mb * 1024 * 1024  # Convert MB to bytes
+
+        # If file is small enough, return None (no splitting needed)
+        if file_size <= max_size:
+            return None, None
 
-    def _split_audio_file(self, audio_path, max_size_mb=CHUNK_SIZE_MB):
-        """Split audio file into chunks that are under the size limit."""
-        if not PYDUB_AVAILABLE:
-            return None, "pydub library not available. Please install it: pip install pydub\nNote: ffmpeg is also required for audio processing."
+        # Put static-ffmpeg's binaries on PATH if installed (runs on a worker
+        # thread, so a first-use download doesn't block the GUI)
+        use_static_ffmpeg()
 
         # Get ffmpeg path from environment
         ffmpeg_custom = os.getenv('FFMPEG_PATH', '')
@@ -68,108 +285,76 @@ class TranscriptionAssistant:
                 "After installing, restart the application."
             )
 
+        temp_dir = out_dir
         try:
             logger.info(f"Starting audio file split for: {audio_path}")
-            # Configure pydub with ffmpeg path BEFORE using it
-            configure_pydub(ffmpeg_path)
-
-            # Double-check the converter and ffprobe are set and the files exist
-            if PYDUB_AVAILABLE and AudioSegment:
-                converter_path = getattr(AudioSegment, 'converter', None)
-                ffprobe_path = getattr(AudioSegment, 'ffprobe', None)
-                logger.debug(f"AudioSegment.converter is set to: {converter_path}")
-                logger.debug(f"AudioSegment.ffprobe is set to: {ffprobe_path}")
-
-                # Fix converter if needed
-                if not converter_path or not os.path.exists(converter_path.replace("/", "\\")):
-                    logger.warning(f"Converter path invalid or not set: {converter_path}, attempting to fix...")
-                    if os.path.isfile(ffmpeg_path):
-                        AudioSegment.converter = os.path.abspath(ffmpeg_path).replace("\\", "/")
-                    elif os.path.isdir(ffmpeg_path):
-                        ffmpeg_exe = os.path.join(ffmpeg_path, "ffmpeg.exe")
-                        if os.path.exists(ffmpeg_exe):
-                            AudioSegment.converter = os.path.abspath(ffmpeg_exe).replace("\\", "/")
-                    AudioSegment.ffmpeg = AudioSegment.converter
-                    logger.info(f"Fixed converter path to: {AudioSegment.converter}")
-
-                # CRITICAL: Ensure ffprobe is set (pydub needs it for media info)
-                if not ffprobe_path or not os.path.exists(ffprobe_path.replace("/", "\\")):
-                    logger.warning(f"ffprobe path invalid or not set: {ffprobe_path}, attempting to fix...")
-                    if os.path.isdir(ffmpeg_path):
-                        ffprobe_exe = os.path.join(ffmpeg_path, "ffprobe.exe")
-                        if os.path.exists(ffprobe_exe):
-                            AudioSegment.ffprobe = os.path.abspath(ffprobe_exe).replace("\\", "/")
-                            logger.info(f"Fixed ffprobe path to: {AudioSegment.ffprobe}")
-                        else:
-                            # Fallback: use ffmpeg if ffprobe doesn't exist
-                            logger.warning("ffprobe.exe not found, using ffmpeg as fallback")
-                            AudioSegment.ffprobe = AudioSegment.converter
-
-            # Load audio file - this is where the error occurs if ffmpeg isn't found
-            logger.debug(f"Loading audio file: {audio_path}")
-            audio = AudioSegment.from_file(audio_path)
-            logger.info(f"Audio file loaded successfully, duration: {len(audio)}ms")
-            file_size = os.path.getsize(audio_path)
-            max_size = max_size_mb * 1024 * 1024  # Convert MB to bytes
-
-            # If file is small enough, return None (no splitting needed)
-            if file_size <= max_size:
-                return None, None
-
-            # Calculate chunk duration based on file size and duration
-            duration_ms = len(audio)
-            bytes_per_ms = file_size / duration_ms if duration_ms > 0 else 0
-            chunk_duration_ms = int((max_size / bytes_per_ms) * CHUNK_SIZE_SAFETY_FACTOR) if bytes_per_ms > 0 else duration_ms
+            duration_ms = _probe_duration_ms(ffmpeg_path, audio_path)
+            logger.info(f"Audio duration: {duration_ms}ms")
+
+            if self.merge_small_chunks:
+                # Chunks are re-encoded at a constant bitrate, so their size depends on
+                # duration alone: use the fewest chunks that fit the upload limit and
+                # spread the audio evenly so there is no short trailing request
+                max_merged_ms = int(
+                    MAX_FILE_SIZE_BYTES * 8 / _bitrate_bps(AUDIO_BITRATE_HIGH) * 1000 * MERGED_CHUNK_SIZE_FACTOR
+                )
+                num_chunks = max(1, -(-duration_ms // max_merged_ms))
+                chunk_duration_ms = -(-duration_ms // num_chunks)
+            else:
+                # Calculate chunk duration based on file size and duration
+                bytes_per_ms = file_size / duration_ms if duration_ms > 0 else 0
+                chunk_duration_ms = int((max_size / bytes_per_ms) * CHUNK_SIZE_SAFETY_FACTOR) if bytes_per_ms > 0 else duration_ms
+
+                # Chunks are re-encoded at a constant bitrate, so also cap the duration
+                # to what fits in max_size at that bitrate
+                max_encoded_ms = int(max_size * 8 / _bitrate_bps(AUDIO_BITRATE_HIGH) * 1000 * CHUNK_SIZE_SAFETY_FACTOR)
+                chunk_duration_ms = min(chunk_duration_ms, max_encoded_ms)
 
             if chunk_duration_ms <= 0:
                 chunk_duration_ms = duration_ms // 2  # Fallback: split in half
 
-            # Create temporary directory for chunks
-            temp_dir = tempfile.mkdtemp()
-            chunk_paths = []
-
-            # Split into chunks
-            num_chunks = (duration_ms // chunk_duration_ms) + (1 if duration_ms % chunk_duration_ms > 0 else 0)
-
-            for i in range(num_chunks):
-                start_ms = i * chunk_duration_ms
-                end_ms = min((i + 1) * chunk_duration_ms, duration_ms)
-
-                chunk = audio[start_ms:end_ms]
-                chunk_path = os.path.join(temp_dir, f"chunk_{i+1}.mp3")
-
-                # Export chunk
-                chunk.export(chunk_path, format="mp3", bitrate=AUDIO_BITRATE_HIGH)
-
-                # Verify chunk size
-                chunk_size = os.path.getsize(chunk_path)
-                if chunk_size > max_size:
-                    # If still too large, try lower bitrate
-                    chunk.export(chunk_path, format="mp3", bitrate=AUDIO_BITRATE_LOW)
-                    chunk_size = os.path.getsize(chunk_path)
-
-                chunk_paths.append(chunk_path)
-
+            # Create temporary directory for chunks and let ffmpeg write them
+            if temp_dir is None:
+                temp_dir = tempfile.mkdtemp(prefix="whispera_")
+            chunk_paths = _ffmpeg_split(
+                ffmpeg_path, audio_path, chunk_duration_ms, AUDIO_BITRATE_HIGH, temp_dir,
+                on_chunk=on_chunk, cancel_event=cancel_event,
+            )
+            if not chunk_paths:
+                raise RuntimeError("ffmpeg did not produce any chunks")
+            logger.info(f"Split into {len(chunk_paths)} chunks of up to {chunk_duration_ms}ms")
             return chunk_paths, None
 
         except Exception as e:
-            logger.error(f"Error splitting audio file: {str(e)}", exc_info=True)
-            # Log converter status for debugging
-            if PYDUB_AVAILABLE and AudioSegment:
-                converter = getattr(AudioSegment, 'converter', None)
-                logger.error(f"AudioSegment.converter at time of error: {converter}")
-            return None, f"Error splitting audio file: {str(e)}\nNote: ffmpeg may be required. Install from: https://ffmpeg.org/"
+            if temp_dir and out_dir is None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info("Audio split cancelled")
+                return None, "Error: Audio split cancelled."
+            details = str(e)
+            if isinstance(e, subprocess.CalledProcessError) and e.stderr:
+                details = e.stderr.decode(errors="replace").strip() or details
+            logger.error(f"Error splitting audio file: {details}", exc_info=True)
+            return None, f"Error splitting audio file: {details}\nNote: ffmpeg may be required. Install from: https://ffmpeg.org/"
 
     def transcribe_audio_chunk(self, audio_path, progress_callback=None, chunk_info=None):
-        """Transcribe a single audio chunk."""
+        """Transcribe a single audio chunk.
+
+        Args:
+            audio_path: Path to an audio file
+        """
         try:
-            with open(audio_path, "rb") as audio_file:
-                transcription = self.client.audio.transcriptions.create(
-                    model=self.audio_model,
-                    file=audio_file,
-                    response_format="text"
-                )
-                return transcription
+            with self._client_in_use() as client:
+                # Pass the open file rather than its bytes: httpx streams it into the
+                # multipart body in small blocks (re-seeking on retries), so even a
+                # full-size chunk is never held in memory
+                with open(audio_path, "rb") as audio_file:
+                    transcription = client.audio.transcriptions.create(
+                        model=self.audio_model,
+                        file=audio_file,
+                        response_format="text"
+                    )
+                    return transcription
         except Exception as e:
             error_msg = str(e)
             if "400" in error_msg or "invalid_request_error" in error_msg:
@@ -179,9 +364,14 @@ class TranscriptionAssistant:
             else:
                 return f"Error during transcription: {error_msg}"
 
-    def transcribe_audio(self, audio_path, progress_callback=None):
-        """Transcribe the uploaded audio file using OpenAI Whisper API."""
-        if not self.client:
+    def transcribe_audio(self, audio_path, progress_callback=None, chunk_callback=None):
+        """Transcribe the uploaded audio file using OpenAI Whisper API.
+
+        When the file is split, chunk_callback (if given) receives each chunk's
+        text in order as soon as it and all earlier chunks are done, including
+        the separator, so joining everything it received gives the full result.
+        """
+        if not self.api_key:
             return "Error: OpenAI API key not set. Please enter your API key in the settings."
 
         file_size = os.path.getsize(audio_path)
@@ -191,31 +381,104 @@ class TranscriptionAssistant:
             if progress_callback:
                 progress_callback(PROGRESS_SPLITTING, 10)
 
-            # Split the file
-            chunk_paths, error = self._split_audio_file(audio_path, max_size_mb=CHUNK_SIZE_MB)
-            if error:
-                return error
+            # Split and transcribe concurrently: ffmpeg hands each finished
+            # chunk to the queue and it is uploaded while the next one encodes
+            chunk_queue = queue.Queue()
+            split_result = {}
+            temp_dir = tempfile.mkdtemp(prefix="whispera_")
+            # Set by the first failed chunk to stop ffmpeg encoding chunks we won't use
+            cancel_event = threading.Event()
+            # Results are stored by index to keep order
+            future_to_index = {}
+
+            def _cancel_job():
+                cancel_event.set()
+                for pending in list(future_to_index):
+                    pending.cancel()
+
+            with self._cancel_lock:
+                self._cancel_callbacks.add(_cancel_job)
+
+            def _produce_chunks():
+                try:
+                    split_result["value"] = self._split_audio_file(
+                        audio_path, max_size_mb=CHUNK_SIZE_MB, on_chunk=chunk_queue.put, out_dir=temp_dir,
+                        cancel_event=cancel_event,
+                    )
+                finally:
+                    chunk_queue.put(None)  # No more chunks
 
-            if not chunk_paths:
-                # File was small enough after processing, transcribe normally
-                return self.transcribe_audio_chunk(audio_path, progress_callback)
+            def _on_chunk_done(future):
+                if not future.cancelled() and future.result().startswith("Error"):
+                    cancel_event.set()
 
-            # Transcribe each chunk
-            transcriptions = []
-            num_chunks = len(chunk_paths)
-            temp_dir = os.path.dirname(chunk_paths[0])
+            producer = threading.Thread(target=_produce_chunks, daemon=True)
+            producer.start()
 
+            chunk_paths = []
             try:
-                for i, chunk_path in enumerate(chunk_paths):
+                max_workers = max(1, self.max_concurrent_chunks)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    while True:
+                        chunk_path = chunk_queue.get()
+                        if chunk_path is None:
+                            break
+                        future = executor.submit(self.transcribe_audio_chunk, chunk_path)
+                        future.add_done_callback(_on_chunk_done)
+                        future_to_index[future] = len(chunk_paths)
+                        chunk_paths.append(chunk_path)
+                        if progress_callback:
+                            progress_callback(f"Transcribing chunk {len(chunk_paths)}...", 15)
+
+                    producer.join()
+                    if cancel_event.is_set():
+                        # A chunk already failed: drop the ones that haven't started
+                        # and report that failure from the loop below
+                        for pending in future_to_index:
+                            pending.cancel()
+                    else:
+                        split_paths, error = split_result.get("value", (None, "Error splitting audio file"))
+                        if error:
+                            for pending in future_to_index:
+                                pending.cancel()
+                            return error
+
+                        if not split_paths:
+                            # File was small enough after processing, transcribe normally
+                            return self.transcribe_audio_chunk(audio_path, progress_callback)
+
+                    num_chunks = len(chunk_paths)
+                    transcriptions = [None] * num_chunks
                     if progress_callback:
-                        progress = 20 + int((i / num_chunks) * 70)
-                        progress_callback(f"Transcribing chunk {i+1} of {num_chunks}...", progress)
-
-                    chunk_transcription = self.transcribe_audio_chunk(chunk_path, progress_callback)
-                    if chunk_transcription.startswith("Error"):
-                        return chunk_transcription
-
-                    transcriptions.append(chunk_transcription)
+                        progress_callback(f"Transcribing {num_chunks} chunks...", 20)
+
+                    completed = 0
+                    next_to_send = 0
+                    for future in as_completed(future_to_index):
+                        if future.cancelled():
+                            continue
+                        chunk_transcription = future.result()
+                        if chunk_transcription.startswith("Error"):
+                            # Drop chunks that haven't started yet
+                            for pending in future_to_index:
+                                pending.cancel()
+                            return chunk_transcription
+
+                        transcriptions[future_to_index[future]] = chunk_transcription
+                        completed += 1
+                        if chunk_callback:
+                            # Hand over the finished chunks that are next in order
+                            while next_to_send < num_chunks and transcriptions[next_to_send] is not None:
+                                separator = "\n\n" if next_to_send else ""
+                                chunk_callback(separator + transcriptions[next_to_send])
+                                next_to_send += 1
+                        if progress_callback:
+                            progress = 20 + int((completed / num_chunks) * 70)
+                            progress_callback(f"Transcribed chunk {completed} of {num_chunks}...", progress)
+
+                if cancel_event.is_set():
+                    # Stopped by cancel(): a failed chunk would have returned above
+                    return "Error: Transcription cancelled."
 
                 # Combine all transcriptions
                 if progress_callback:
@@ -229,15 +492,12 @@ class TranscriptionAssistant:
                 return combined_transcription
 
             finally:
-                # Clean up temporary chunk files
-                try:
-                    for chunk_path in chunk_paths:
-                        if os.path.exists(chunk_path):
-                            os.remove(chunk_path)
-                    if os.path.exists(temp_dir):
-                        os.rmdir(temp_dir)
-                except Exception:
-                    pass  # Ignore cleanup errors
+                # Stop ffmpeg if it is still running and wait for it before removing chunks
+                cancel_event.set()
+                producer.join()
+                shutil.rmtree(temp_dir, ignore_errors=True)
+                with self._cancel_lock:
+                    self._cancel_callbacks.discard(_cancel_job)
 
         # File is small enough, transcribe normally
         if progress_callback:
@@ -251,7 +511,7 @@ class TranscriptionAssistant:
         except Exception as e:
             return f"Error during transcription: {str(e)}"
 
-    def process_audio(self, audio_path, progress_callback=None):
+    def process_audio(self, audio_path, progress_callback=None, chunk_callback=None):
         """Handle the complete process: transcribe audio to text."""
         if progress_callback:
             progress_callback("Processing file...", 10)
@@ -266,11 +526,11 @@ class TranscriptionAssistant:
 
             # Check file format
             file_lower = audio_path.lower()
-            if not any(file_lower.endswith(ext) for ext in SUPPORTED_FORMATS):
-                return f"Error: Unsupported file format. Supported formats: {', '.join(SUPPORTED_FORMATS)}"
+            if not file_lower.endswith(_SUPPORTED_EXTS):
+                return f"Error: Unsupported file format. Supported formats: {', '.join(sorted(SUPPORTED_FORMATS))}"
 
             # Get transcription
-            transcription = self.transcribe_audio(audio_path, progress_callback)
+            transcription = self.transcribe_audio(audio_path, progress_callback, chunk_callback)
 
             if transcription.startswith("Error"):
                 return transcription
@@ -1,6 +1,9 @@
 """GUI for the Audio Transcription App."""
 
 import os
+import queue
+import re
+import sys
 import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
@@ -11,12 +14,54 @@ from src.back.constants import (
     FONT_TITLE,
     FONT_NORMAL,
     FONT_TEXT,
+    EVENT_POLL_INTERVAL_MS,
     PROGRESS_READY,
     SUPPORTED_FORMATS,
+    MAX_FILE_SIZE_MB,
     MAX_FILE_SIZE_BYTES,
 )
+from src.back.config import get_application_path, get_ffmpeg_install_root, use_static_ffmpeg
+from src.back.ffmpeg_downloader import download_ffmpeg_tools
 from src.back.transcription import TranscriptionAssistant
 from src.back.env_manager import read_env_file, write_env_file
+from src.back.logging_config import logger
+
+_IS_WIN32 = sys.platform == 'win32'
+
+# Background worker threads shared by the startup ffmpeg check/download,
+# transcription and settings jobs
+_WORKER_COUNT = 3
+
+
+def _scan_ffmpeg_dir(folder):
+    """List the lowercased file names in a folder with a single directory read.
+
+    Returns an empty set if the folder is missing or unreadable.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return {entry.name.lower() for entry in entries}
+    except OSError:
+        return set()
+
+
+# File dialog filters, built once rather than on every click
+_FILE_TYPES_GLOB = " ".join(f"*{ext}" for ext in sorted(SUPPORTED_FORMATS))
+_FILE_TYPES = (
+    ("Audio/Video Files", _FILE_TYPES_GLOB),
+    ("MP3 Files", "*.mp3"),
+    ("MP4 Files", "*.mp4"),
+    ("All Audio Files", _FILE_TYPES_GLOB),
+    ("All Files", "*.*"),
+)
+
+# Files above 90% of the upload limit are highlighted when selected
+_WARN_FILE_SIZE_BYTES = int(MAX_FILE_SIZE_BYTES * 0.9)
+
+# Format-only check for OpenAI keys ("sk-..." / "sk-proj-..."), so an obvious
+# typo is caught before it reaches the SDK or the network
+_OPENAI_KEY_RE = re.compile(r"sk-(?:proj-)?[A-Za-z0-9_\-]{20,}")
+_INVALID_KEY_MESSAGE = "OpenAI API keys start with 'sk-' followed by letters, digits, '-' or '_'. Please check your key."
 
 
 class TranscriptionGUI:
@@ -24,24 +69,50 @@ class TranscriptionGUI:
 
     def __init__(self, initial_api_key=None):
         """Initialize the GUI application."""
-        # Initialize assistant with API key if available
-        self.assistant = TranscriptionAssistant(api_key=initial_api_key)
+        # Assistant is created on first use, with the API key if available
+        self._assistant = None
+        self._initial_api_key = initial_api_key
         self.root = tk.Tk()
         self.root.title(WINDOW_TITLE)
         self.root.geometry(WINDOW_SIZE)
         self.root.resizable(True, True)
 
-        # Selected file path
+        # Selected file path, and a large file waiting for the user to confirm
         self.selected_file = None
+        self._pending_file = None
+
+        # Transcription text area and copy button are built on first file selection
+        self._result_widgets_built = False
+
+        # Last transcript, kept so copying doesn't have to read it back from Tk
+        self._full_transcript = None
+
+        # Chunk texts already shown while a split file is being transcribed
+        self._transcript_parts = []
+
+        # Percentage the progress bar currently shows
+        self._last_pct = 0
 
         # Load API key (ffmpeg is auto-detected in ffmpeg/ folder at project root)
         self.loaded_api_key = initial_api_key or ""
+        # Whether the current key passes the format check (see _load_api_key)
+        self._api_key_valid = True
 
         # Status message for startup/download progress
         self.status_message = tk.StringVar(value="Initializing...")
+        self._status_hide_id = None
+
+        # Events posted by worker threads as (kind, *args), applied on the Tk thread
+        self._events = queue.Queue()
+
+        # Jobs for the background worker threads, as (func, args)
+        self._jobs = queue.Queue()
+        self._start_workers()
 
         self._create_widgets()
         self._load_api_key()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.after(EVENT_POLL_INTERVAL_MS, self._poll_events)
 
         # Check for ffmpeg after GUI is created (so we can show messages)
         self.root.after(100, self._check_ffmpeg_on_startup)
@@ -110,6 +181,16 @@ class TranscriptionGUI:
         )
         self.save_api_btn.grid(row=0, column=2)
 
+        # Shown when the key loaded at startup fails the format check
+        self.api_key_hint = ttk.Label(
+            api_frame,
+            text=f"⚠️ The API key loaded from .env or OPENAI_API_KEY doesn't look valid. {_INVALID_KEY_MESSAGE}",
+            foreground="orange",
+            wraplength=700
+        )
+        self.api_key_hint.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
+        self.api_key_hint.grid_remove()
+
         # File selection frame
         file_frame = ttk.Frame(main_frame)
         file_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
@@ -131,6 +212,24 @@ class TranscriptionGUI:
         )
         self.file_label.grid(row=0, column=1, sticky=tk.W)
 
+        # Inline confirmation for large files, shown under the file label
+        # instead of a modal dialog so the event loop keeps running
+        self._confirm_frame = ttk.Frame(file_frame)
+        self._confirm_frame.grid(row=1, column=0, columnspan=2, sticky=tk.W, pady=(5, 0))
+        self._confirm_label = ttk.Label(self._confirm_frame, foreground="orange")
+        self._confirm_label.grid(row=0, column=0, columnspan=2, sticky=tk.W)
+        ttk.Button(
+            self._confirm_frame,
+            text="Yes",
+            command=self._confirm_large_file
+        ).grid(row=1, column=0, padx=(0, 5), pady=(5, 0), sticky=tk.W)
+        ttk.Button(
+            self._confirm_frame,
+            text="No",
+            command=self._cancel_large_file
+        ).grid(row=1, column=1, pady=(5, 0), sticky=tk.W)
+        self._confirm_frame.grid_remove()
+
         # Transcribe button
         self.transcribe_btn = ttk.Button(
             main_frame,
@@ -156,12 +255,28 @@ class TranscriptionGUI:
         )
         self.progress_bar.grid(row=7, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 20))
 
+        # Placeholder for the transcription area, reserving its grid row so the
+        # layout doesn't jump when _create_result_widgets() fills it
+        self.result_frame = ttk.Frame(main_frame)
+        self.result_frame.grid(row=8, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.result_frame.columnconfigure(0, weight=1)
+        self.result_frame.rowconfigure(0, weight=1)
+        main_frame.rowconfigure(8, weight=1)
+
+    def _create_result_widgets(self):
+        """Create the transcription text area and copy button on first use.
+
+        ScrolledText is slow to build, so it is kept off the startup path.
+        """
+        if self._result_widgets_built:
+            return
+        self._result_widgets_built = True
+
         # Transcription text area
-        text_frame = ttk.LabelFrame(main_frame, text="Transcription", padding="5")
-        text_frame.grid(row=8, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        text_frame = ttk.LabelFrame(self.result_frame, text="Transcription", padding="5")
+        text_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
         text_frame.columnconfigure(0, weight=1)
         text_frame.rowconfigure(0, weight=1)
-        main_frame.rowconfigure(8, weight=1)
 
         self.text_area = scrolledtext.ScrolledText(
             text_frame,
@@ -171,74 +286,121 @@ class TranscriptionGUI:
             font=FONT_TEXT
         )
         self.text_area.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        # "result" marks transcription text; it is hidden (elided) rather than
+        # deleted while a new transcription runs and the placeholder is shown
+        self.text_area.tag_config("result", elide=False)
 
         # Copy button
         self.copy_btn = ttk.Button(
-            main_frame,
+            self.result_frame,
             text="Copy to Clipboard",
             command=self._copy_to_clipboard,
             state="disabled"
         )
-        self.copy_btn.grid(row=9, column=0, columnspan=2, pady=(0, 10))
+        self.copy_btn.grid(row=1, column=0, pady=(0, 10))
+
+    def _start_workers(self):
+        """Start the worker threads that run background jobs.
+
+        These are reused for every job instead of spawning a thread per click.
+        They are daemon threads (ThreadPoolExecutor's are not), so they never
+        keep the process alive. The chunk uploads of a split file do run on a
+        ThreadPoolExecutor, so _on_close cancels them; only uploads already in
+        flight are waited for at exit.
+        """
+        for i in range(_WORKER_COUNT):
+            thread = threading.Thread(target=self._run_jobs, name=f"whispera-worker-{i}")
+            thread.daemon = True
+            thread.start()
+
+    def _run_jobs(self):
+        """Run queued jobs forever (worker thread loop)."""
+        while True:
+            func, args = self._jobs.get()
+            try:
+                func(*args)
+            except Exception:
+                logger.exception("Background job failed")
+
+    def _submit(self, func, *args):
+        """Run func(*args) on a background worker thread."""
+        self._jobs.put((func, args))
+
+    @property
+    def assistant(self):
+        """Transcription assistant, created on first use."""
+        if self._assistant is None:
+            self._assistant = TranscriptionAssistant(api_key=self._initial_api_key)
+        return self._assistant
 
     def _load_api_key(self):
         """Load API key from .env file and populate the field."""
+        # The assistant picks the key up from _initial_api_key when it is created
         if self.loaded_api_key:
             self.api_key_var.set(self.loaded_api_key)
-            self.assistant.set_api_key(self.loaded_api_key)
+            # Checked once here, so a bad key from .env or the environment is
+            # flagged up front rather than when Transcribe is clicked
+            self._api_key_valid = bool(_OPENAI_KEY_RE.fullmatch(self.loaded_api_key))
+            if not self._api_key_valid:
+                self.api_key_hint.grid()
 
     def _check_ffmpeg_on_startup(self):
         """Check for ffmpeg tools on startup and show status messages."""
-        import sys
-        from src.back.config import get_application_path
-        from src.back.ffmpeg_downloader import download_ffmpeg_tools
-
-        if sys.platform == 'win32':
-            app_path = get_application_path()
-            ffmpeg_dir = os.path.join(app_path, 'ffmpeg')
-            ffmpeg_exe = os.path.join(ffmpeg_dir, 'ffmpeg.exe')
-            ffprobe_exe = os.path.join(ffmpeg_dir, 'ffprobe.exe')
-
-            # Check what's missing
-            if not os.path.exists(ffprobe_exe) or (not os.path.exists(ffmpeg_exe) and not os.path.exists(ffprobe_exe)):
-                # Show download dialog
-                self.status_message.set("Checking for ffmpeg tools...")
-                self.root.update_idletasks()
-
-                # Download in a separate thread to avoid freezing GUI
-                def download_thread():
-                    def update_status(msg):
-                        """Update status message in GUI thread safely."""
-                        self.root.after(0, lambda: self.status_message.set(msg))
-
-                    # Pass callback to download function
-                    download_ffmpeg_tools(app_path, status_callback=update_status)
-
-                    # Check final status and hide status after a delay
-                    def hide_status_after_delay():
-                        """Hide status frame after showing final message."""
-                        self.root.after(3000, lambda: self.status_frame.grid_remove())
-
-                    if os.path.exists(ffmpeg_exe) and os.path.exists(ffprobe_exe):
-                        self.root.after(0, lambda: self.status_message.set("✅ Ready - ffmpeg tools are available"))
-                        self.root.after(0, hide_status_after_delay)
-                    elif os.path.exists(ffmpeg_exe):
-                        self.root.after(0, lambda: self.status_message.set("⚠️ Warning - ffmpeg.exe found but ffprobe.exe is missing"))
-                        self.root.after(0, hide_status_after_delay)
-                    else:
-                        self.root.after(0, lambda: self.status_message.set("❌ Error - ffmpeg tools not found. Please download manually."))
-
-                thread = threading.Thread(target=download_thread)
-                thread.daemon = True
-                thread.start()
-            else:
-                self.status_message.set("✅ Ready - All tools available")
-                # Hide status after showing ready message
-                self.root.after(2000, lambda: self.status_frame.grid_remove())
+        if _IS_WIN32:
+            # Disk probes and the download run off the Tk thread; results come
+            # back through the event queue
+            self.status_message.set("Checking for ffmpeg tools...")
+            self._submit(self._probe_and_maybe_download)
         else:
-            self.status_message.set("✅ Ready")
             # Hide status after showing ready message
-            self.root.after(2000, lambda: self.status_frame.grid_remove())
+            self._set_status("✅ Ready", hide_after_ms=2000)
+
+    def _probe_ffmpeg(self):
+        """Look for installed ffmpeg tools (runs on a worker thread).
+
+        Returns:
+            dict: {"ffmpeg": bool, "ffprobe": bool, "dir": folder downloads go to}.
+            If no folder has both tools, the flags describe the download folder,
+            since that is where download_ffmpeg_tools fills in what's missing.
+        """
+        # Downloads go to the per-user cache so other installs can reuse them
+        app_path = get_ffmpeg_install_root()
+        if use_static_ffmpeg():
+            return {"ffmpeg": True, "ffprobe": True, "dir": app_path}
+
+        names = _scan_ffmpeg_dir(os.path.join(app_path, 'ffmpeg'))
+        download_state = {"ffmpeg": 'ffmpeg.exe' in names, "ffprobe": 'ffprobe.exe' in names, "dir": app_path}
+        if download_state["ffmpeg"] and download_state["ffprobe"]:
+            return download_state
+
+        # Tools may also come from the project-local ffmpeg/ folder
+        names = _scan_ffmpeg_dir(os.path.join(get_application_path(), 'ffmpeg'))
+        if 'ffmpeg.exe' in names and 'ffprobe.exe' in names:
+            return {"ffmpeg": True, "ffprobe": True, "dir": app_path}
+        return download_state
+
+    def _probe_and_maybe_download(self):
+        """Find ffmpeg tools and download any that are missing (runs on a worker thread)."""
+        def update_status(msg, hide_after_ms=None):
+            """Post a status message to the GUI thread."""
+            self._events.put(("status", msg, hide_after_ms))
+
+        state = self._probe_ffmpeg()
+        if state["ffmpeg"] and state["ffprobe"]:
+            # Hide status after showing ready message
+            update_status("✅ Ready - All tools available", hide_after_ms=2000)
+            return
+
+        # The downloader reports what it ended up with, so no need to probe again
+        state["ffmpeg"], state["ffprobe"] = download_ffmpeg_tools(state["dir"], status_callback=update_status)
+
+        # Show final status and hide it after a delay
+        if state["ffmpeg"] and state["ffprobe"]:
+            update_status("✅ Ready - ffmpeg tools are available", hide_after_ms=3000)
+        elif state["ffmpeg"]:
+            update_status("⚠️ Warning - ffmpeg.exe found but ffprobe.exe is missing", hide_after_ms=3000)
+        else:
+            update_status("❌ Error - ffmpeg tools not found. Please download manually.")
 
     def _save_api_key(self):
         """Save API key to .env file."""
@@ -248,6 +410,18 @@ class TranscriptionGUI:
             messagebox.showwarning("Warning", "Please enter an API key.")
             return
 
+        if not _OPENAI_KEY_RE.fullmatch(api_key):
+            messagebox.showwarning("Invalid API Key Format", _INVALID_KEY_MESSAGE)
+            return
+
+        # The .env read/write runs on a worker thread; the result comes back
+        # through the event queue. The assistant is resolved here so it is
+        # only ever created on the Tk thread.
+        self.save_api_btn.state(["disabled"])
+        self._submit(self._save_api_key_worker, self.assistant, api_key)
+
+    def _save_api_key_worker(self, assistant, api_key):
+        """Write the API key to the .env file (runs on a worker thread)."""
         try:
             # Read existing .env file
             env_vars = read_env_file()
@@ -259,29 +433,34 @@ class TranscriptionGUI:
             write_env_file(env_vars)
 
             # Update the assistant
-            self.assistant.set_api_key(api_key)
+            assistant.set_api_key(api_key)
 
-            messagebox.showinfo("Success", "API key saved successfully!")
+            self._events.put(("api_saved", None))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save API key: {str(e)}")
+            self._events.put(("api_saved", str(e)))
+
+    def _api_key_saved(self, error):
+        """Report the result of saving the API key."""
+        self.save_api_btn.state(["!disabled"])
+        if error is None:
+            # Only keys that passed the format check get saved
+            self._api_key_valid = True
+            self.api_key_hint.grid_remove()
+            self._set_status("✅ API key saved successfully!", hide_after_ms=3000)
+        else:
+            messagebox.showerror("Error", f"Failed to save API key: {error}")
 
     def _select_file(self):
         """Open file dialog to select audio/video file."""
-        # Build file types string
-        file_types_str = " ".join([f"*{ext}" for ext in SUPPORTED_FORMATS])
-
         file_path = filedialog.askopenfilename(
             title="Select Audio or Video File",
-            filetypes=[
-                ("Audio/Video Files", file_types_str),
-                ("MP3 Files", "*.mp3"),
-                ("MP4 Files", "*.mp4"),
-                ("All Audio Files", file_types_str),
-                ("All Files", "*.*")
-            ]
+            filetypes=_FILE_TYPES
         )
 
         if file_path:
+            self._create_result_widgets()
+            self._confirm_frame.grid_remove()
+            self._pending_file = None
             self.selected_file = file_path
             filename = os.path.basename(file_path)
 
@@ -297,36 +476,118 @@ class TranscriptionGUI:
                 if file_size > MAX_FILE_SIZE_BYTES:
                     # File is large but we can split it automatically
                     self.file_label.config(text=file_info, foreground="orange")
-                    # Show info message about automatic splitting
-                    response = messagebox.askyesno(
-                        "Large File Detected",
-                        f"File size: {size_mb:.1f}MB (exceeds {MAX_FILE_SIZE_BYTES / (1024*1024):.0f}MB limit)\n\n"
-                        f"The app will automatically split this file into chunks and transcribe each part.\n"
-                        f"This may take longer but will work for files of any size.\n\n"
-                        f"Continue with automatic splitting?",
-                        icon="question"
+                    # Ask about automatic splitting; the file is used once confirmed
+                    self.selected_file = None
+                    self._pending_file = file_path
+                    self.transcribe_btn.state(["disabled"])
+                    self._confirm_label.config(
+                        text=f"File size: {size_mb:.1f}MB (exceeds {MAX_FILE_SIZE_MB}MB limit). "
+                             f"It will be split into chunks and each part transcribed, which may take longer.\n"
+                             f"Continue with automatic splitting?"
                     )
-                    if not response:
-                        return
+                    self._confirm_frame.grid()
+                    return
                 # File is acceptable (will be split automatically if needed)
-                elif file_size > MAX_FILE_SIZE_BYTES * 0.9:  # > 90% of limit
+                elif file_size > _WARN_FILE_SIZE_BYTES:
                     self.file_label.config(text=file_info, foreground="orange")
                 else:
                     self.file_label.config(text=file_info, foreground="black")
             except Exception:
                 self.file_label.config(text=filename, foreground="black")
 
-            # Enable transcribe button only if API key is set
-            if self.assistant.client:
-                self.transcribe_btn.config(state="normal")
-            else:
-                messagebox.showwarning("API Key Required", "Please enter and save your OpenAI API key first.")
+            self._enable_transcribe()
+
+    def _confirm_large_file(self):
+        """Use the large file waiting for confirmation."""
+        self._confirm_frame.grid_remove()
+        self.selected_file = self._pending_file
+        self._pending_file = None
+        self._enable_transcribe()
+
+    def _cancel_large_file(self):
+        """Drop the large file waiting for confirmation."""
+        self._confirm_frame.grid_remove()
+        self._pending_file = None
+        self.file_label.config(text="No file selected", foreground="gray")
+
+    def _enable_transcribe(self):
+        """Enable the transcribe button only if a well-formed API key is set."""
+        if not self.assistant.api_key:
+            self._set_status("⚠️ Please enter and save your OpenAI API key first.")
+        elif self._api_key_valid:
+            self.transcribe_btn.state(["!disabled"])
+        # Otherwise api_key_hint already says what is wrong with the key
+
+    def _poll_events(self):
+        """Apply all events posted by worker threads, then poll again.
+
+        Events are applied in order, except that a run of progress updates
+        collapses to its latest value and a run of chunk texts is inserted in
+        one go, so Tk sees at most one change of each per poll however often
+        the backend reports.
+        """
+        handlers = {
+            "status": self._set_status,
+            "api_saved": self._api_key_saved,
+            "done": self._transcription_complete,
+            "error": self._transcription_error,
+        }
+        progress = None
+        chunk_texts = []
+        try:
+            while True:
+                try:
+                    kind, *args = self._events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "progress":
+                    progress = args
+                    continue
+                if kind == "chunk_text":
+                    chunk_texts.append(args[0])
+                    continue
+                if progress is not None:
+                    self._apply_progress(*progress)
+                    progress = None
+                if chunk_texts:
+                    self._append_result("".join(chunk_texts))
+                    chunk_texts = []
+                handlers[kind](*args)
+            if progress is not None:
+                self._apply_progress(*progress)
+            if chunk_texts:
+                self._append_result("".join(chunk_texts))
+        finally:
+            self.root.after(EVENT_POLL_INTERVAL_MS, self._poll_events)
+
+    def _set_status(self, message, hide_after_ms=None):
+        """Show a status message, optionally hiding the status area after a delay."""
+        # A newer message replaces any pending hide and shows the area again
+        if self._status_hide_id is not None:
+            self.root.after_cancel(self._status_hide_id)
+            self._status_hide_id = None
+        self.status_message.set(message)
+        self.status_frame.grid()
+        if hide_after_ms is not None:
+            self._status_hide_id = self.root.after(hide_after_ms, self._hide_status)
+
+    def _hide_status(self):
+        """Hide the status message area."""
+        self._status_hide_id = None
+        self.status_frame.grid_remove()
 
     def _update_progress(self, message, value):
+        """Post a progress update (called from the transcription thread)."""
+        self._events.put(("progress", message, value))
+
+    def _apply_progress(self, message, value):
         """Update progress bar and label."""
         self.progress_var.set(message)
-        self.progress_bar['value'] = value
-        self.root.update_idletasks()
+        # Several steps report the same percentage; only touch the bar when it moves
+        pct = int(value)
+        if pct != self._last_pct:
+            self.progress_bar.configure(value=pct)
+            self._last_pct = pct
 
     def _transcribe_file(self):
         """Transcribe the selected file."""
@@ -334,63 +595,130 @@ class TranscriptionGUI:
             messagebox.showerror("Error", "Please select a file first.")
             return
 
-        if not self.assistant.client:
+        if not self.assistant.api_key:
             messagebox.showerror("Error", "Please enter and save your OpenAI API key first.")
             return
 
+        if not _OPENAI_KEY_RE.fullmatch(self.assistant.api_key):
+            messagebox.showerror("Invalid API Key Format", _INVALID_KEY_MESSAGE)
+            return
+
         # Disable buttons during transcription
-        self.select_btn.config(state="disabled")
-        self.transcribe_btn.config(state="disabled")
-        self.copy_btn.config(state="disabled")
-        self.text_area.delete(1.0, tk.END)
-        self.text_area.insert(tk.END, "Transcribing... Please wait...")
+        self.select_btn.state(["disabled"])
+        self.transcribe_btn.state(["disabled"])
+        self.copy_btn.state(["disabled"])
+        self._transcript_parts = []
+        self._show_placeholder("Transcribing... Please wait...")
 
-        # Run transcription in a separate thread to avoid freezing GUI
-        thread = threading.Thread(target=self._transcribe_thread)
-        thread.daemon = True
-        thread.start()
+        # Run transcription on a worker thread to avoid freezing GUI
+        self._submit(self._transcribe_thread)
 
     def _transcribe_thread(self):
         """Run transcription in a separate thread."""
         try:
             result = self.assistant.process_audio(
                 self.selected_file,
-                progress_callback=self._update_progress
+                progress_callback=self._update_progress,
+                chunk_callback=self._post_chunk_text
             )
 
             # Update GUI in main thread
-            self.root.after(0, self._transcription_complete, result)
+            self._events.put(("done", result))
         except Exception as e:
-            self.root.after(0, self._transcription_error, str(e))
+            self._events.put(("error", str(e)))
+
+    def _post_chunk_text(self, text):
+        """Post a finished chunk's text (called from the transcription thread)."""
+        self._events.put(("chunk_text", text))
+
+    def _append_result(self, text):
+        """Append streamed chunk text, replacing the placeholder on the first chunk."""
+        if not self._transcript_parts:
+            self._clear_previous_result()
+            self.text_area.tag_config("result", elide=False)
+        self._transcript_parts.append(text)
+        self.text_area.insert(tk.END, text, "result")
+        self.text_area.see(tk.END)
+
+    def _show_placeholder(self, message):
+        """Hide the current text and show a short message in its place.
+
+        The previous result stays in the buffer, elided, so Tk doesn't have
+        to free and re-layout it until the new result replaces it.
+        """
+        self.text_area.tag_add("result", 1.0, tk.END)
+        self.text_area.tag_config("result", elide=True)
+        self.text_area.insert(1.0, message, "placeholder")
+
+    def _clear_previous_result(self):
+        """Delete the placeholder and the hidden previous result.
+
+        Only the tagged ranges are deleted, rather than the whole buffer. The
+        old result still has to be freed here; hiding it only moves that cost
+        from the start of a run to the moment the new text arrives.
+        """
+        for tag in ("placeholder", "result"):
+            ranges = self.text_area.tag_ranges(tag)
+            # Delete from the end so earlier indices stay valid
+            for i in range(len(ranges) - 2, -1, -2):
+                self.text_area.delete(ranges[i], ranges[i + 1])
+
+    def _show_result(self, text):
+        """Replace the placeholder and any hidden result with text."""
+        self._clear_previous_result()
+        self.text_area.insert(tk.END, text, "result")
+        self.text_area.tag_config("result", elide=False)
+        # Cleared so copying can tell whether the user has edited the text since
+        self.text_area.edit_modified(False)
+
+    def _set_ready_state(self, status_text, can_copy=True):
+        """Re-enable the buttons and reset the progress bar after a transcription."""
+        # state() sets the ttk state flag directly instead of parsing a -state option
+        self.select_btn.state(["!disabled"])
+        self.transcribe_btn.state(["!disabled"])
+        if can_copy:
+            self.copy_btn.state(["!disabled"])
+        self.progress_bar.configure(value=0)
+        self._last_pct = 0
+        self.progress_var.set(status_text)
 
     def _transcription_complete(self, transcription):
         """Handle transcription completion."""
-        self.text_area.delete(1.0, tk.END)
-        self.text_area.insert(1.0, transcription)
-        self.select_btn.config(state="normal")
-        self.transcribe_btn.config(state="normal")
-        self.copy_btn.config(state="normal")
-        self.progress_bar['value'] = 0
-        self.progress_var.set(PROGRESS_READY)
+        self._full_transcript = transcription
+        if self._transcript_parts and "".join(self._transcript_parts) == transcription:
+            # Already streamed in chunk by chunk; no need to insert it again
+            self.text_area.edit_modified(False)
+        else:
+            self._show_result(transcription)
+        self._transcript_parts = []
+        self._set_ready_state(PROGRESS_READY)
 
     def _transcription_error(self, error_msg):
         """Handle transcription error."""
-        self.text_area.delete(1.0, tk.END)
-        self.text_area.insert(1.0, f"Error: {error_msg}")
-        self.select_btn.config(state="normal")
-        self.transcribe_btn.config(state="normal")
-        self.progress_bar['value'] = 0
-        self.progress_var.set("Error occurred")
+        self._full_transcript = None
+        self._transcript_parts = []
+        self._show_result(f"Error: {error_msg}")
+        self._set_ready_state("Error occurred", can_copy=False)
         messagebox.showerror("Transcription Error", error_msg)
 
     def _copy_to_clipboard(self):
         """Copy transcription text to clipboard."""
-        text = self.text_area.get(1.0, tk.END).strip()
+        # Use the stored transcript unless the user has edited the text area
+        if self._full_transcript is not None and not self.text_area.edit_modified():
+            text = self._full_transcript.strip()
+        else:
+            text = self.text_area.get(1.0, tk.END).strip()
         if text:
             self.root.clipboard_clear()
             self.root.clipboard_append(text)
             messagebox.showinfo("Copied", "Transcription copied to clipboard!")
 
+    def _on_close(self):
+        """Stop any split transcription in progress and close the window."""
+        if self._assistant is not None:
+            self._assistant.cancel()
+        self.root.destroy()
+
     def launch(self):
         """Launch the GUI application."""
         self.root.mainloop()